@@ -5,10 +5,31 @@ Handles all CARLA simulator interactions:
 - Connection management
 - Vehicle spawning and control
 - Sensor setup and data collection
+
+Classes are resolved lazily (PEP 562): a submodule, and with it carla and
+numpy, is only imported when one of its names is first accessed.
 """
 
-from .connection import CARLAConnection
-from .vehicle import VehicleManager
-from .sensors import CameraSensor
+import importlib
 
 __all__ = ['CARLAConnection', 'VehicleManager', 'CameraSensor']
+
+# Exported name -> defining submodule
+_EXPORT_SOURCES = {
+    'CARLAConnection': '.connection',
+    'VehicleManager': '.vehicle',
+    'CameraSensor': '.sensors',
+}
+_EXPORTS = frozenset(__all__)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORT_SOURCES[name], __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _EXPORTS)
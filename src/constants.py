@@ -8,6 +8,8 @@ All configurable values have been moved to config.yaml (common or module-specifi
 Use ConfigManager.load() to access configuration values.
 """
 
+import sys
+
 
 class MessageTopics:
     """ZMQ message topic identifiers (protocol constants)."""
@@ -19,12 +21,12 @@ class MessageTopics:
 
 
 class ActionTypes:
-    """Action type identifiers for event system."""
+    """Action type identifiers for event system (interned for dispatch-dict lookups)."""
 
-    RESPAWN = "respawn"
-    PAUSE = "pause"
-    RESUME = "resume"
-    QUIT = "quit"
+    RESPAWN = sys.intern("respawn")
+    PAUSE = sys.intern("pause")
+    RESUME = sys.intern("resume")
+    QUIT = sys.intern("quit")
 
 
 # Convenience exports
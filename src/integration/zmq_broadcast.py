@@ -2,28 +2,13 @@
 ZMQ Pub-Sub Broadcasting - Backward Compatibility Wrapper
 
 This module re-exports all ZMQ communication utilities from skynet-common
-for backward compatibility with existing code.
+for backward compatibility with existing code. The re-exports are resolved
+lazily, on first attribute access.
 
 New code should import directly from skynet_common.communication.
 """
 
-# Re-export everything from skynet-common for backward compatibility
-from skynet_common.communication.zmq_broadcast import (
-    # Data structures
-    FrameData,
-    DetectionData,
-    VehicleState,
-    ParameterUpdate,
-    # Publishers
-    VehicleBroadcaster,
-    ActionPublisher,
-    ParameterPublisher,
-    VehicleStatusPublisher,
-    # Subscribers
-    ViewerSubscriber,
-    ActionSubscriber,
-    ParameterSubscriber,
-)
+import importlib
 
 __all__ = [
     # Data structures
@@ -41,3 +26,19 @@ __all__ = [
     "ActionSubscriber",
     "ParameterSubscriber",
 ]
+
+# Resolved lazily (PEP 562): skynet-common is only imported when a name is first accessed
+_REEXPORT_SOURCE = "skynet_common.communication.zmq_broadcast"
+_REEXPORTS = frozenset(__all__)
+
+
+def __getattr__(name):
+    if name not in _REEXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_REEXPORT_SOURCE), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _REEXPORTS)
@@ -12,9 +12,10 @@ from typing import Optional, Callable
 from dataclasses import dataclass
 
 from simulation import CARLAConnection, VehicleManager, CameraSensor
+from simulation.constants import ActionTypes
 from lkas import LKAS
 from lkas.integration.messages import ControlMessage, ControlMode
-from simulation.integration.zmq_broadcast import (
+from skynet_common.communication.zmq_broadcast import (
     VehicleStatusPublisher,
     ActionSubscriber,
     VehicleState,
@@ -24,15 +25,14 @@ from rich.live import Live
 from rich.table import Table
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SimulationConfig:
-    """Configuration for simulation orchestrator."""
+    """Configuration for simulation orchestrator (immutable once built)."""
     carla_host: str
     carla_port: int
     image_shm_name: str
     detection_shm_name: str
     detector_timeout: int
-    enable_broadcast: bool
     broadcast_url: str
     action_url: str
     enable_autopilot: bool
@@ -230,9 +230,9 @@ class SimulationOrchestrator:
             return
 
         # Register action handlers
-        self.action_subscriber.register_action('respawn', self._handle_respawn)
-        self.action_subscriber.register_action('pause', self._handle_pause)
-        self.action_subscriber.register_action('resume', self._handle_resume)
+        self.action_subscriber.register_action(ActionTypes.RESPAWN, self._handle_respawn)
+        self.action_subscriber.register_action(ActionTypes.PAUSE, self._handle_pause)
+        self.action_subscriber.register_action(ActionTypes.RESUME, self._handle_resume)
 
         print("\n✓ Action handlers registered")
         print("  Actions: respawn, pause, resume")
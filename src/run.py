@@ -8,125 +8,241 @@ Features:
 - Clean architecture with dependency injection
 
 Usage:
-    simulation --broadcast
+    simulation
 
 Note: This has been refactored to use SimulationOrchestrator for clean architecture.
 """
 
-import argparse
+import dataclasses
+import operator
+import re
 import sys
+import types
+from typing import TYPE_CHECKING, Callable, NamedTuple
 
-from skynet_common.config import ConfigManager
-from simulation.orchestrator import SimulationOrchestrator, SimulationConfig
+if TYPE_CHECKING:
+    import argparse
 
+    from simulation.orchestrator import SimulationConfig
 
-def parse_arguments(config) -> argparse.Namespace:
-    """
-    Parse command-line arguments.
 
-    Args:
-        config: System configuration for defaults
+class _Argument(NamedTuple):
+    """Command-line option; drives both the fast parser and argparse."""
 
-    Returns:
-        Parsed arguments
-    """
-    parser = argparse.ArgumentParser(
-        description="Distributed Lane Keeping System - CARLA Client"
-    )
+    flag: str
+    dest: str
+    convert: Callable | None  # None: switch that stores `not default` when present
+    default: object = None  # Value, or callable(comm, tp) returning it
+    help: str | None = None
 
+
+_ARGUMENTS = (
     # System options
-    parser.add_argument(
+    _Argument(
         "--config",
-        type=str,
-        default=None,
+        "config",
+        str,
         help="Path to configuration file (default: <project-root>/config.yaml)",
-    )
-    parser.add_argument(
-        "--host", type=str, default=None, help="CARLA server host (overrides config)"
-    )
-    parser.add_argument(
-        "--port", type=int, default=None, help="CARLA server port (overrides config)"
-    )
-    parser.add_argument("--spawn-point", type=int, default=None)
-
+    ),
+    _Argument("--host", "host", str, help="CARLA server host (overrides config)"),
+    _Argument("--port", "port", int, help="CARLA server port (overrides config)"),
+    _Argument("--spawn-point", "spawn_point", int),
     # Shared memory detection (default and only IPC method)
-    parser.add_argument(
+    _Argument(
         "--image-shm-name",
-        type=str,
-        default=config.communication.image_shm_name,
-        help=f"Shared memory name for camera images (default: {config.communication.image_shm_name})",
-    )
-    parser.add_argument(
+        "image_shm_name",
+        str,
+        default=lambda comm, tp: comm.image_shm_name,
+        help="Shared memory name for camera images (default: %(default)s)",
+    ),
+    _Argument(
         "--detection-shm-name",
-        type=str,
-        default=config.communication.detection_shm_name,
-        help=f"Shared memory name for detection results (default: {config.communication.detection_shm_name})",
-    )
-    parser.add_argument(
+        "detection_shm_name",
+        str,
+        default=lambda comm, tp: comm.detection_shm_name,
+        help="Shared memory name for detection results (default: %(default)s)",
+    ),
+    _Argument(
         "--detector-timeout",
-        type=int,
+        "detector_timeout",
+        int,
         default=1000,  # Module-specific: 1000ms
-        help="Detection timeout in milliseconds (default: 1000)",
-    )
-
+        help="Detection timeout in milliseconds (default: %(default)s)",
+    ),
     # Other options
-    parser.add_argument("--autopilot", action="store_true")
-    parser.add_argument(
-        "--no-sync", action="store_true", help="Disable synchronous mode"
-    )
-    parser.add_argument(
+    _Argument("--autopilot", "enable_autopilot", None, default=False),
+    _Argument("--no-sync", "enable_sync_mode", None, default=True, help="Disable synchronous mode"),
+    _Argument(
         "--base-throttle",
-        type=float,
-        default=config.throttle_policy.base,
-        help=f"Base throttle during initialization/failures (default: {config.throttle_policy.base})",
-    )
-    parser.add_argument(
+        "base_throttle",
+        float,
+        default=lambda comm, tp: tp.base,
+        help="Base throttle during initialization/failures (default: %(default)s)",
+    ),
+    _Argument(
         "--warmup-frames",
-        type=int,
+        "warmup_frames",
+        int,
         default=50,  # Module-specific: 50 frames
-        help="Frames to use base throttle before full control (default: 50)",
-    )
-    parser.add_argument(
+        help="Frames to use base throttle before full control (default: %(default)s)",
+    ),
+    _Argument(
         "--latency",
-        action="store_true",
+        "enable_latency_tracking",
+        None,
+        default=False,
         help="Enable latency tracking and reporting (adds overhead)",
-    )
-
-    parser.add_argument(
+    ),
+    _Argument(
         "--control-shm-name",
-        type=str,
-        default=config.communication.control_shm_name,
-        help=f"Shared memory name for control commands (default: {config.communication.control_shm_name})",
-    )
-
-    # ZMQ Broadcasting options (legacy - always enabled now)
-    parser.add_argument(
-        "--broadcast",
-        action="store_true",
-        help="(Legacy flag - broadcasting is now always enabled for viewer support)",
-    )
-    parser.add_argument(
+        "control_shm_name",
+        str,
+        default=lambda comm, tp: comm.control_shm_name,
+        help="Shared memory name for control commands (default: %(default)s)",
+    ),
+    # ZMQ Broadcasting options (always enabled)
+    _Argument(
         "--broadcast-url",
-        type=str,
-        default=f"tcp://*:{config.communication.zmq_broadcast_port}",
-        help=f"ZMQ URL for broadcasting vehicle data (default: tcp://*:{config.communication.zmq_broadcast_port})",
-    )
-    parser.add_argument(
+        "broadcast_url",
+        str,
+        default=lambda comm, tp: f"tcp://*:{comm.zmq_broadcast_port}",
+        help="ZMQ URL for broadcasting vehicle data (default: %(default)s)",
+    ),
+    _Argument(
         "--action-url",
-        type=str,
-        default=f"tcp://*:{config.communication.zmq_action_port}",
-        help=f"ZMQ URL for receiving actions (default: tcp://*:{config.communication.zmq_action_port})",
-    )
-    parser.add_argument(
+        "action_url",
+        str,
+        default=lambda comm, tp: f"tcp://*:{comm.zmq_action_port}",
+        help="ZMQ URL for receiving actions (default: %(default)s)",
+    ),
+    _Argument(
         "--verbose",
-        action="store_true",
+        "verbose",
+        None,
+        default=False,
         help="Enable verbose output (lane status, steering info)",
-    )
+    ),
+)
+_ARGUMENTS_BY_FLAG = {arg.flag: arg for arg in _ARGUMENTS}
+# argparse's rule for a "-..." token that is still a value rather than a flag
+_NEGATIVE_NUMBER = re.compile(r"^-\d+$|^-\d*\.\d+$")
 
-    return parser.parse_args()
 
+def _warn_without_libyaml():
+    """Warn when PyYAML lacks its libyaml C extension (no fast C loader available)."""
+    import yaml
 
-def print_banner(config: SimulationConfig, system_config: object):
+    if not getattr(yaml, "__with_libyaml__", False):
+        print("⚠ PyYAML is installed without libyaml - C-accelerated YAML loading is unavailable")
+
+
+def _load_config(path: str | None):
+    """
+    Load configuration.
+
+    Args:
+        path: Path to configuration file (None uses ConfigManager's default)
+
+    Returns:
+        System configuration
+    """
+    from skynet_common.config import ConfigManager
+
+    _warn_without_libyaml()
+    return ConfigManager.load(path)
+
+
+def _defaults(config) -> dict:
+    """
+    Default value for every argument destination.
+
+    Args:
+        config: System configuration for defaults
+
+    Returns:
+        Mapping of dest -> default, shared by the fast parser and argparse
+    """
+    comm = config.communication
+    tp = config.throttle_policy
+
+    return {
+        arg.dest: arg.default(comm, tp) if callable(arg.default) else arg.default
+        for arg in _ARGUMENTS
+    }
+
+
+def _fast_parse(argv: list[str]) -> dict | None:
+    """
+    Single-pass argument parser for the common (valid, no --help) case.
+
+    Args:
+        argv: Arguments to parse (without program name)
+
+    Returns:
+        Mapping of dest -> value for the arguments given, or None if argparse
+        must handle them (--help, unknown or abbreviated flags, bad values)
+    """
+    values = {}
+    it = iter(argv)
+    for token in it:
+        flag, has_inline, inline = token.partition("=")
+        arg = _ARGUMENTS_BY_FLAG.get(flag)
+        if arg is None:
+            return None
+        if arg.convert is None:
+            if has_inline:
+                return None
+            values[arg.dest] = not arg.default
+            continue
+
+        raw = inline if has_inline else next(it, None)
+        # A following flag is not a value (negative numbers are, as in argparse)
+        if raw is None or (
+            not has_inline and raw.startswith("-") and not _NEGATIVE_NUMBER.match(raw)
+        ):
+            return None
+        try:
+            values[arg.dest] = arg.convert(raw)
+        except ValueError:
+            return None
+    return values
+
+
+def parse_arguments(config, argv: list[str] | None = None) -> "argparse.Namespace":
+    """
+    Parse command-line arguments.
+
+    Args:
+        config: System configuration for defaults
+        argv: Arguments to parse (default: sys.argv[1:])
+
+    Returns:
+        Parsed arguments
+    """
+    import argparse
+
+    defaults = _defaults(config)
+
+    parser = argparse.ArgumentParser(
+        description="Distributed Lane Keeping System - CARLA Client"
+    )
+    for arg in _ARGUMENTS:
+        if arg.convert is None:
+            action = "store_false" if arg.default else "store_true"
+            parser.add_argument(arg.flag, dest=arg.dest, action=action, help=arg.help)
+        else:
+            parser.add_argument(
+                arg.flag,
+                dest=arg.dest,
+                type=arg.convert,
+                default=defaults[arg.dest],
+                help=arg.help,
+            )
+
+    return parser.parse_args(argv)
+
+
+def print_banner(config: "SimulationConfig", system_config: object):
     """
     Print startup banner with configuration.
 
@@ -134,73 +250,71 @@ def print_banner(config: SimulationConfig, system_config: object):
         config: Simulation configuration
         system_config: System-wide configuration
     """
-    print("\n" + "=" * 60)
-    print("DISTRIBUTED LANE KEEPING SYSTEM")
-    print("=" * 60)
-    print(f"CARLA Server: {config.carla_host}:{config.carla_port}")
-
-    print(f"SHARED MEMORY TABLE")
-    print(f"  Image: {config.image_shm_name}")
-    print(f"  Detection: {config.detection_shm_name}")
-    print(f"  Control: {config.control_shm_name}")
-    print(f"  Timeout: {config.detector_timeout}ms")
-
-    print(f"Camera: {system_config.camera.width}x{system_config.camera.height}")
-
-    # ZMQ Broadcasting
-    if config.enable_broadcast:
-        print(f"ZMQ Broadcasting: ENABLED")
-        print(f"  Broadcast URL: {config.broadcast_url}")
-        print(f"  Action URL: {config.action_url}")
-    else:
-        print(f"ZMQ Broadcasting: DISABLED (use --broadcast to enable)")
-
-    print("=" * 60)
+    camera = system_config.camera
+    lines = [
+        "\n" + "=" * 60,
+        "DISTRIBUTED LANE KEEPING SYSTEM",
+        "=" * 60,
+        f"CARLA Server: {config.carla_host}:{config.carla_port}",
+        "SHARED MEMORY TABLE",
+        f"  Image: {config.image_shm_name}",
+        f"  Detection: {config.detection_shm_name}",
+        f"  Control: {config.control_shm_name}",
+        f"  Timeout: {config.detector_timeout}ms",
+        f"Camera: {camera.width}x{camera.height}",
+
+        # ZMQ Broadcasting
+        "ZMQ Broadcasting: ENABLED",
+        f"  Broadcast URL: {config.broadcast_url}",
+        f"  Action URL: {config.action_url}",
+        "=" * 60,
+    ]
+
+    # Single write instead of one print (and stdout lock/flush) per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
     """Main entry point for distributed CARLA client with ZMQ broadcasting."""
     # Load configuration first (for defaults)
     print("\nLoading configuration...")
-    # Check if --config is in sys.argv
-    config_path = None
-    for i, arg in enumerate(sys.argv):
-        if arg == "--config" and i + 1 < len(sys.argv):
-            config_path = sys.argv[i + 1]
-            break
-    system_config = ConfigManager.load(config_path)
+    # Common case: one pass over argv without importing argparse
+    values = _fast_parse(sys.argv[1:])
+    if values is not None:
+        config_path = values.get("config")
+    else:
+        # --help, errors, abbreviations: pre-parse --config only, argparse does the rest
+        import argparse
+
+        pre_parser = argparse.ArgumentParser(add_help=False, exit_on_error=False)
+        pre_parser.add_argument("--config", type=str, default=None)
+        try:
+            pre_args, remaining = pre_parser.parse_known_args()
+            config_path = pre_args.config
+        except argparse.ArgumentError:
+            # Malformed --config: use the default config and let the full parser report it
+            config_path, remaining = None, None
+
+    system_config = _load_config(config_path)
     print(f"✓ Configuration loaded")
 
-    # Parse arguments with config defaults
-    args = parse_arguments(system_config)
+    # Fill in config defaults
+    if values is not None:
+        args = types.SimpleNamespace(**{**_defaults(system_config), **values})
+    else:
+        args = parse_arguments(system_config, remaining)
 
-    # Reload config if a different path was specified
-    if args.config and args.config != config_path:
-        system_config = ConfigManager.load(args.config)
+    # Deferred until arguments are valid: pulls in CARLA, LKAS, ZMQ and numpy
+    from simulation.orchestrator import SimulationOrchestrator, SimulationConfig
 
     # Determine CARLA connection params
-    carla_host = args.host if args.host else system_config.carla.host
-    carla_port = args.port if args.port else system_config.carla.port
-
-    # Create simulation configuration
-    sim_config = SimulationConfig(
-        carla_host=carla_host,
-        carla_port=carla_port,
-        spawn_point=args.spawn_point,
-        image_shm_name=args.image_shm_name,
-        detection_shm_name=args.detection_shm_name,
-        detector_timeout=args.detector_timeout,
-        enable_broadcast=args.broadcast,
-        broadcast_url=args.broadcast_url,
-        action_url=args.action_url,
-        enable_autopilot=args.autopilot,
-        enable_sync_mode=not args.no_sync,
-        base_throttle=args.base_throttle,
-        warmup_frames=args.warmup_frames,
-        enable_latency_tracking=args.latency,
-        control_shm_name=args.control_shm_name,
-        verbose=args.verbose,
-    )
+    args.carla_host = args.host if args.host else system_config.carla.host
+    args.carla_port = args.port if args.port else system_config.carla.port
+
+    # Create simulation configuration positionally; argparse dests match the field
+    # names, and reading them from the dataclass keeps the order from drifting
+    fields = operator.attrgetter(*(f.name for f in dataclasses.fields(SimulationConfig)))
+    sim_config = SimulationConfig(*fields(args))
 
     # Print banner
     print_banner(sim_config, system_config)
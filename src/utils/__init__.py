@@ -8,13 +8,31 @@ compatibility by re-exporting it.
 Note: LKASVisualizer and LaneDepartureStatus have been moved to skynet-common
 package to enable platform-independent usage. This module re-exports them
 for backwards compatibility.
-"""
 
-# Re-export from decision module for backwards compatibility
-from lkas.decision.lane_analyzer import LaneAnalyzer
+Re-exports are resolved lazily (PEP 562): the source module is only imported
+when a name is first accessed.
+"""
 
-# Re-export from skynet-common for backwards compatibility
-from skynet_common.types import LaneDepartureStatus
-from skynet_common.visualization import LKASVisualizer
+import importlib
 
 __all__ = ['LaneAnalyzer', 'LaneDepartureStatus', 'LKASVisualizer']
+
+# Re-exported name -> source module (backwards compatibility)
+_REEXPORT_SOURCES = {
+    'LaneAnalyzer': 'lkas.decision.lane_analyzer',
+    'LaneDepartureStatus': 'skynet_common.types',
+    'LKASVisualizer': 'skynet_common.visualization',
+}
+_REEXPORTS = frozenset(__all__)
+
+
+def __getattr__(name):
+    if name not in _REEXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_REEXPORT_SOURCES[name]), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _REEXPORTS)